@@ -7,11 +7,28 @@ import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
 import tkinter as tk
 from tkinter import ttk
+import math
 import os
+
 from io import BytesIO
-import atexit
 import sys
 
+try:
+    from numba import njit
+except ImportError:
+    # 无Numba时退化为纯Python执行
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def decorator(func):
+            return func
+        return decorator
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr为可选加速，缺失时退回NumPy
+    ne = None
+
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei']  # 设置默认字体为黑体
 plt.rcParams['axes.unicode_minus'] = False     # 解决负号显示问题
@@ -22,79 +39,132 @@ RADIUS = 0.025  # 灯泡半径 (m)
 AIR_CONDUCTIVITY = 0.026  # 空气导热系数 (W/m·K)
 SURFACE_HEAT_TRANSFER = 5  # 表面换热系数 (W/m²·K)
 
-def cleanup():
-    """清理资源并确保程序完全退出"""
+# 预计算的网格和派生常量（每次更新只有功率/环境温度变化）
+# float32已满足显示精度，渲染路径的内存带宽减半
+DISTANCES = np.linspace(0.05, 0.5, 50, dtype=np.float32)   # 距离范围 5-50cm (转换为米)
+AMBIENT_TEMPS = np.linspace(10, 30, 50, dtype=np.float32)  # 环境温度范围
+DISTANCES_CM = DISTANCES * 100
+DISTANCE_GRID_CM, AMBIENT_GRID = np.meshgrid(DISTANCES_CM, AMBIENT_TEMPS)
+SURFACE_AREA = 4 * np.pi * RADIUS**2
+DISTANCE_FACTOR = (RADIUS / DISTANCES) ** 1.5      # 距离衰减因子
+DISTANCE_DECAY = np.exp(-DISTANCES / (2 * RADIUS))  # 指数衰减因子
+
+def cleanup(root=None):
+    """销毁窗口并立即退出
+
+    跳过plt.close('all')的逐图遍历——直接销毁Tk窗口后交给
+    os._exit让操作系统回收内存，关闭更快。
+    """
     try:
-        # 关闭所有matplotlib图形
-        plt.close('all')
-        
-        # 强制退出程序
+        if root is not None:
+            root.quit()
+            root.destroy()
+    finally:
         os._exit(0)
-    except:
-        pass
 
-# 注册退出处理程序
-atexit.register(cleanup)
+# find_31_degree_point的复用缓冲区，避免每次更新分配临时数组
+_DIFF_BUF_3D = np.empty((50, 50), dtype=np.float32)
+_DIFF_BUF_2D = np.empty(50, dtype=np.float32)
 
 def find_31_degree_point(distance_grid, ambient_temp_grid, temp_grid):
     """找到温度最接近31度的点"""
-    if len(temp_grid.shape) == 2:
+    buf = _DIFF_BUF_3D if temp_grid.ndim == 2 else _DIFF_BUF_2D
+    if buf.shape != temp_grid.shape:
+        buf = np.empty_like(temp_grid)
+    np.subtract(temp_grid, 31, out=buf)
+    np.abs(buf, out=buf)
+    if temp_grid.ndim == 2:
         # 3D模式
-        diff = np.abs(temp_grid - 31)
-        i, j = np.unravel_index(diff.argmin(), diff.shape)
+        i, j = divmod(buf.argmin(), temp_grid.shape[1])
         return distance_grid[i,j], ambient_temp_grid[i,j], temp_grid[i,j]
     else:
         # 2D模式
-        diff = np.abs(temp_grid - 31)
-        idx = diff.argmin()
+        idx = buf.argmin()
         return distance_grid[idx], None, temp_grid[idx]
 
 def get_31_degree_contour(distance_grid, temp_grid, ambient_temps):
-    """获取31度等温线上的点"""
-    points = []
-    for i, temp_row in enumerate(temp_grid):
-        for j in range(len(temp_row)-1):
-            if (temp_row[j] - 31) * (temp_row[j+1] - 31) <= 0:
-                # 找到一个穿过31度的点
-                t = (31 - temp_row[j]) / (temp_row[j+1] - temp_row[j])
-                d = distance_grid[i,j] + t * (distance_grid[i,j+1] - distance_grid[i,j])
-                points.append((d, ambient_temps[i], 31))
-    return np.array(points) if points else np.array([])
-
-def calculate_temperature(fixed_ambient_temp=None):
+    """获取31度等温线上的点（向量化的符号变化检测）"""
+    # 相邻两点温差符号相反处即穿过31度
+    s = temp_grid - 31.0
+    i_idx, j_idx = np.nonzero(s[:, :-1] * s[:, 1:] <= 0)
+    if len(i_idx) == 0:
+        return np.array([])
+
+    # 线性插值求交点距离，防止除零
+    s0 = s[i_idx, j_idx]
+    denom = s[i_idx, j_idx+1] - s0
+    t = -s0 / np.where(denom != 0, denom, 1.0)
+    d = distance_grid[i_idx, j_idx] + t * (distance_grid[i_idx, j_idx+1] - distance_grid[i_idx, j_idx])
+    return np.column_stack([d, ambient_temps[i_idx], np.full_like(d, 31.0)])
+
+def calculate_grid_temperature(T_amb, power=POWER):
+    """在预计算的距离网格上一次性计算温度（NumPy广播）
+
+    T_amb可以是标量（2D模式）或列向量（3D模式），
+    距离衰减因子在模块载入时已预先算好。
+    """
+    # 1. 计算灯泡表面温度
+    Ts = T_amb + (power * 3) / (SURFACE_HEAT_TRANSFER * SURFACE_AREA)
+
+    # 2+3. 温升与距离衰减的闭式表达
+    if ne is not None:
+        # numexpr将表达式融合为单次分块遍历（SIMD+多线程）
+        T = ne.evaluate(
+            "T_amb + (Ts - T_amb) * factor * power_factor * decay",
+            local_dict={'T_amb': T_amb, 'Ts': Ts,
+                        'factor': DISTANCE_FACTOR,
+                        'power_factor': np.float32(power / 15.0),
+                        'decay': DISTANCE_DECAY})
+    else:
+        T = T_amb + (Ts - T_amb) * DISTANCE_FACTOR * (power / 15.0) * DISTANCE_DECAY
+
+    # 确保温度在合理范围内
+    return np.clip(T, T_amb, Ts, out=T)
+
+def calculate_temperature(fixed_ambient_temp=None, power=POWER):
     """计算空气温度分布"""
-    # 生成网格数据
-    distances = np.linspace(0.05, 0.5, 50)  # 距离范围 5-50cm (转换为米)
-    ambient_temps = np.linspace(10, 30, 50)  # 环境温度范围
-    
     if fixed_ambient_temp is None:
-        # 3D模式
-        D, T_env = np.meshgrid(distances, ambient_temps)
-        T = np.array([[calculate_single_point(d, t) for d in distances] for t in ambient_temps])
-        return D*100, T_env, T, ambient_temps
+        # 3D模式：广播为(50,50)网格
+        T = calculate_grid_temperature(AMBIENT_TEMPS[:, None], power)
+        return DISTANCE_GRID_CM, AMBIENT_GRID, T, AMBIENT_TEMPS
     else:
         # 2D模式
-        D = distances
-        T = np.array([calculate_single_point(d, fixed_ambient_temp) for d in distances])
-        return D*100, fixed_ambient_temp, T, None
+        T = calculate_grid_temperature(np.float32(fixed_ambient_temp), power)
+        return DISTANCES_CM, fixed_ambient_temp, T, None
 
-def calculate_single_point(d, T_amb):
-    """计算单点温度"""
+@njit(cache=True, fastmath=True)
+def calculate_single_point(d, T_amb, power=15.0):
+    """计算单点温度（标量备用路径，网格计算请用calculate_grid_temperature）"""
     # 1. 计算灯泡表面温度
-    surface_area = 4 * np.pi * RADIUS**2
+    surface_area = 4 * math.pi * RADIUS**2
     # 灯泡表面温度随功率线性增加
-    Ts = T_amb + (POWER * 3) / (SURFACE_HEAT_TRANSFER * surface_area)
-    
+    Ts = T_amb + (power * 3) / (SURFACE_HEAT_TRANSFER * surface_area)
+
     # 2. 计算空气温升
-    power_factor = (POWER / 15.0)  # 线性功率影响
+    power_factor = (power / 15.0)  # 线性功率影响
     distance_factor = (RADIUS / d) ** 1.5  # 距离衰减
-    
+
     # 温升计算（考虑功率和距离的综合影响）
     delta_T = (Ts - T_amb) * distance_factor * power_factor
-    
-    # 3. 应用距离衰减并确保温度在合理范围内
-    T = T_amb + delta_T * np.exp(-d/(2*RADIUS))
-    return min(max(T, T_amb), Ts)
+
+    # 3. 应用距离衰减并确保温度在合理范围内（无分支，数组调用同样适用）
+    T = T_amb + delta_T * math.exp(-d/(2*RADIUS))
+    return np.minimum(np.maximum(T, T_amb), Ts)
+
+# 导入时预热JIT编译，避免首次交互更新被编译阻塞
+calculate_single_point(0.1, 20.0, 15.0)
+
+def surface_quads(X, Y, Z):
+    """把曲面网格切成(n,4,3)四边形数组，供Poly3DCollection.set_verts使用"""
+    corners = [np.stack([A[:-1, :-1], A[1:, :-1], A[1:, 1:], A[:-1, 1:]], axis=-1)
+               for A in (X, Y, Z)]
+    quads = np.stack(corners, axis=-1)  # (n-1, m-1, 4, 3)
+    return quads.reshape(-1, 4, 3)
+
+def surface_quad_values(Z):
+    """每个四边形的平均温度，用于曲面着色"""
+    avg = (Z[:-1, :-1] + Z[1:, :-1] + Z[1:, 1:] + Z[:-1, 1:]) / 4.0
+    return avg.ravel()
 
 class BulbAnalyzer(tk.Tk):
     def __init__(self):
@@ -158,14 +228,55 @@ class BulbAnalyzer(tk.Tk):
         toolbar = NavigationToolbar2Tk(self.canvas, main_frame)
         toolbar.update()
         
-        # 绑定事件
-        power_slider.bind("<B1-Motion>", self.update_plot)
-        power_slider.bind("<ButtonRelease-1>", self.update_plot)
+        # 绑定事件（经过防抖合并，拖动期间只保留最后一次请求）
+        self._pending_update = None
+        self._drag_stride = 1  # 拖动时降采样步长，松开后恢复全分辨率
+        self._last_render = None  # 上次渲染的参数快照，用于跳过无感知变化
+        # 窗口缩放等完整绘制会作废2D模式缓存的背景位图，
+        # 挂在draw_event上重新抓取
+        self._in_bg_draw = False
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        power_slider.bind("<B1-Motion>", self._on_slider_drag)
+        power_slider.bind("<ButtonRelease-1>", self._on_slider_release)
         self.temp_var.trace_add("write", self.on_temp_change)
 
         # 初始绘图
         self.update_plot(None)
 
+    def _on_draw(self, event):
+        """完整绘制后刷新2D模式的背景缓存
+
+        窗口缩放会让后端自行做一次完整绘制（animated的曲线、标记
+        和标题不参与），缓存的旧背景位图尺寸随之失效；这里重新
+        抓取，并让下一次更新绕过render_key短路把动画对象补绘回来。
+        """
+        if self.is_3d or self.line_2d is None:
+            return
+        self._bg_2d = self.canvas.copy_from_bbox(self.fig.bbox)
+        if not self._in_bg_draw:
+            self._last_render = None
+            self.request_update()
+
+    def _on_slider_drag(self, event=None):
+        """拖动过程中用粗网格渲染曲面，保持交互流畅"""
+        self._drag_stride = 2
+        self.request_update()
+
+    def _on_slider_release(self, event=None):
+        """松开滑块后恢复全分辨率渲染"""
+        self._drag_stride = 1
+        self.request_update()
+
+    def request_update(self, event=None):
+        """合并密集的更新请求，只在事件流稳定后重绘一次"""
+        if self._pending_update is not None:
+            self.after_cancel(self._pending_update)
+        self._pending_update = self.after(50, self._do_update)
+
+    def _do_update(self):
+        self._pending_update = None
+        self.update_plot(None)
+
     def toggle_temp_input(self):
         """切换固定环境温度设置"""
         # 更新状态
@@ -176,101 +287,171 @@ class BulbAnalyzer(tk.Tk):
             self.temp_entry.config(state='normal')
         else:
             self.temp_entry.config(state='disabled')
-        
-        # 重新创建图形
-        self.create_subplot()
+
+        # 子图重建由update_plot按需处理
         self.update_plot(None)
 
     def create_subplot(self):
-        """创建子图"""
+        """创建子图并重置缓存的绘图对象"""
+        self._subplot_is_3d = self.is_3d
         self.fig.clear()
         if self.is_3d:
             self.ax = self.fig.add_subplot(111, projection='3d')
         else:
             self.ax = self.fig.add_subplot(111)
+        # 缓存的绘图对象（仅在子图重建时失效）
+        self.surf = None
+        self.contour_line = None
+        self.point_31 = None
+        self.cbar = None
+        # 2D模式的blitting缓存
+        self.line_2d = None
+        self.point_2d = None
+        self._bg_2d = None
+        self._ylim_2d = None
 
     def on_temp_change(self, *args):
         """处理温度变化"""
         try:
             float(self.temp_var.get())
-            self.update_plot(None)
+            self.request_update()
         except:
             pass
 
     def update_plot(self, event):
         """更新图形显示"""
-        global POWER
-        POWER = self.power_var.get()
-        
-        # 计算新的温度分布
+        power = self.power_var.get()
         fixed_temp = self.temp_var.get() if self.fixed_temp_var.get() else None
-        distance_grid, ambient_temp_grid, temp_grid, ambient_temps = calculate_temperature(fixed_temp)
-        
+
+        # 变化低于可感知阈值（0.1W / 0.1°C）时跳过整个重绘
+        render_key = (round(power, 1),
+                      None if fixed_temp is None else round(fixed_temp, 1),
+                      self.is_3d, self._drag_stride)
+        if render_key == self._last_render:
+            return
+        self._last_render = render_key
+
+        # 仅当2D/3D模式真正切换时重建子图，否则复用现有坐标轴
+        if self._subplot_is_3d != self.is_3d:
+            self.create_subplot()
+
+        # 计算新的温度分布
+        distance_grid, ambient_temp_grid, temp_grid, ambient_temps = calculate_temperature(fixed_temp, power)
+
         # 找到31度点
         d31, t31_amb, t31 = find_31_degree_point(distance_grid, ambient_temp_grid, temp_grid)
-        
-        # 清除并重新创建图形
-        self.create_subplot()
-        
+
         if self.is_3d:
-            # 绘制3D曲面
-            surf = self.ax.plot_surface(distance_grid, ambient_temp_grid, temp_grid, 
-                                      cmap='coolwarm',
-                                      rstride=1, cstride=1,
-                                      linewidth=0, antialiased=True)
-            
-            # 绘制31度等温线
+            if self.surf is None:
+                # 首次绘制：创建曲面及配套对象并缓存
+                self.surf = self.ax.plot_surface(distance_grid, ambient_temp_grid, temp_grid,
+                                               cmap='coolwarm',
+                                               rstride=1, cstride=1,
+                                               linewidth=0, antialiased=True)
+                self.contour_line, = self.ax.plot([], [], [], 'r-', linewidth=2,
+                                                label='31°C等温线')
+                self.point_31, = self.ax.plot([], [], [], linestyle='', marker='o',
+                                            color='red', markersize=10, label='31°C点')
+
+                self.ax.set_xlabel('距离 (cm)')
+                self.ax.set_ylabel('环境温度 (°C)')
+                self.ax.set_zlabel('空气温度 (°C)')
+
+                # 添加颜色条
+                self.cbar = self.fig.colorbar(self.surf, ax=self.ax, shrink=0.5,
+                                            aspect=5, label='温度 (°C)')
+                self.ax.legend()
+                self.fig.tight_layout()
+            else:
+                # 后续更新：原位替换曲面顶点和着色，避免重建Poly3DCollection
+                # 拖动时按步长降采样，渲染的四边形数量减为约1/stride²
+                s = self._drag_stride
+                D, A, T = distance_grid[::s, ::s], ambient_temp_grid[::s, ::s], temp_grid[::s, ::s]
+                self.surf.set_verts(surface_quads(D, A, T))
+                self.surf.set_array(surface_quad_values(T))
+                self.surf.set_clim(temp_grid.min(), temp_grid.max())
+
+            self.ax.set_zlim(temp_grid.min(), temp_grid.max())
+            self.ax.set_title(f'{power}W 白炽灯泡周围空气温度分布')
+
+            # 更新31度等温线
             contour_points = get_31_degree_contour(distance_grid, temp_grid, ambient_temps)
             if len(contour_points) > 0:
-                self.ax.plot(contour_points[:,0], contour_points[:,1], contour_points[:,2], 
-                           'r-', linewidth=2, label='31°C等温线')
-            
+                self.contour_line.set_data_3d(contour_points[:,0], contour_points[:,1],
+                                            contour_points[:,2])
+            else:
+                self.contour_line.set_data_3d([], [], [])
+
             # 标注31度点
             if t31_amb is not None:
-                self.ax.scatter([d31], [t31_amb], [t31], color='red', s=100, label='31°C点')
-            
-            self.ax.set_xlabel('距离 (cm)')
-            self.ax.set_ylabel('环境温度 (°C)')
-            self.ax.set_zlabel('空气温度 (°C)')
-            self.ax.set_title(f'{POWER}W 白炽灯泡周围空气温度分布')
-            
-            # 添加颜色条
-            self.fig.colorbar(surf, ax=self.ax, shrink=0.5, aspect=5, label='温度 (°C)')
-            self.ax.legend()
+                self.point_31.set_data_3d([d31], [t31_amb], [t31])
 
             # 更新信息显示
             if len(contour_points) > 0:
                 contour_eq = f"31°C等温线方程：T(d,t) = 31°C"
                 point_info = f"31°C点坐标：(d={d31:.1f}cm, t={t31_amb:.1f}°C, T=31°C)"
                 self.info_label.config(text=f"{contour_eq}\n{point_info}")
-            
+
+            # 更新画布
+            self.canvas.draw()
+
         else:
-            # 绘制2D曲线
-            self.ax.plot(distance_grid, temp_grid, 'b-', linewidth=2)
-            
-            # 标注31度点
+            # 2D模式：静态部分（坐标轴/网格/图例）作为背景位图缓存，
+            # 每次更新只重绘曲线、标记点和标题后blit
+            y_min, y_max = float(temp_grid.min()), float(temp_grid.max())
+            pad = max(1.0, (y_max - y_min) * 0.1)
+
+            if self.line_2d is None:
+                # 首次绘制：建立静态坐标轴并抓取背景
+                self.line_2d, = self.ax.plot(distance_grid, temp_grid, 'b-',
+                                           linewidth=2, animated=True)
+                self.point_2d, = self.ax.plot([], [], 'ro', markersize=10,
+                                            label='31°C点', animated=True)
+                self.ax.title.set_animated(True)
+                self.ax.set_xlabel('距离 (cm)')
+                self.ax.set_ylabel('温度 (°C)')
+                self.ax.grid(True)
+                self.ax.legend()
+                self.ax.set_xlim(distance_grid[0], distance_grid[-1])
+                self._ylim_2d = (y_min - pad, y_max + pad)
+                self.ax.set_ylim(*self._ylim_2d)
+                self.fig.tight_layout()
+                self._in_bg_draw = True
+                try:
+                    self.canvas.draw()  # 背景位图由draw_event回调抓取
+                finally:
+                    self._in_bg_draw = False
+            elif not (self._ylim_2d[0] <= y_min and y_max <= self._ylim_2d[1]):
+                # 数据超出当前坐标范围时重建背景
+                self._ylim_2d = (y_min - pad, y_max + pad)
+                self.ax.set_ylim(*self._ylim_2d)
+                self._in_bg_draw = True
+                try:
+                    self.canvas.draw()
+                finally:
+                    self._in_bg_draw = False
+
+            # 更新动画对象并blit
+            self.line_2d.set_data(distance_grid, temp_grid)
             if t31 is not None:
-                self.ax.plot([d31], [t31], 'ro', markersize=10, label='31°C点')
-            
-            self.ax.set_xlabel('距离 (cm)')
-            self.ax.set_ylabel('温度 (°C)')
-            self.ax.set_title(f'{POWER}W 白炽灯泡温度-距离关系\n(环境温度: {self.temp_var.get()}°C)')
-            self.ax.grid(True)
-            self.ax.legend()
+                self.point_2d.set_data([d31], [t31])
+            self.ax.set_title(f'{power}W 白炽灯泡温度-距离关系\n(环境温度: {self.temp_var.get()}°C)')
+
+            self.canvas.restore_region(self._bg_2d)
+            self.ax.draw_artist(self.line_2d)
+            self.ax.draw_artist(self.point_2d)
+            self.ax.draw_artist(self.ax.title)
+            self.canvas.blit(self.fig.bbox)
 
             # 更新信息显示
             point_info = f"31°C点坐标：(d={d31:.1f}cm, T=31°C)"
             self.info_label.config(text=point_info)
-        
-        # 调整图形布局并更新
-        self.fig.tight_layout()
-        self.canvas.draw()
 
 if __name__ == "__main__":
     app = BulbAnalyzer()
     # 添加窗口关闭事件处理
-    app.protocol("WM_DELETE_WINDOW", cleanup)
+    app.protocol("WM_DELETE_WINDOW", lambda: cleanup(app))
     try:
         app.mainloop()
     finally:
-        cleanup()
+        cleanup(app)
@@ -2,6 +2,7 @@
 """
 创建简单的程序图标
 """
+import numpy as np
 from PIL import Image, ImageDraw
 
 def create_icon():
@@ -35,15 +36,16 @@ def create_icon():
         base_top + base_height
     ], fill=(192, 192, 192, 255), outline=border_color, width=2)
 
-    # 添加光线效果
-    for angle in range(0, 360, 45):
-        from math import sin, cos, radians
-        length = 25
-        start_x = center[0] + (radius + 5) * cos(radians(angle))
-        start_y = center[1] + (radius + 5) * sin(radians(angle))
-        end_x = center[0] + (radius + length) * cos(radians(angle))
-        end_y = center[1] + (radius + length) * sin(radians(angle))
-        draw.line([(start_x, start_y), (end_x, end_y)], 
+    # 添加光线效果（端点坐标一次性向量化计算）
+    length = 25
+    angles = np.deg2rad(np.arange(0, 360, 45))
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    start_x = center[0] + (radius + 5) * cos_a
+    start_y = center[1] + (radius + 5) * sin_a
+    end_x = center[0] + (radius + length) * cos_a
+    end_y = center[1] + (radius + length) * sin_a
+    for sx, sy, ex, ey in zip(start_x, start_y, end_x, end_y):
+        draw.line([(sx, sy), (ex, ey)],
                  fill=(255, 255, 0, 128), width=3)
 
     # 保存为ICO格式
@@ -0,0 +1,39 @@
+"""离屏批量渲染
+
+参数扫描之类的批处理不需要Tk窗口：每个任务自带Figure和Agg画布，
+Agg栅格化与contour的C扩展在工作期间会释放GIL，线程池里多张图
+可以接近线性地并行渲染。绘制逻辑与GUI共用visualization模块。
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from .visualization import draw_temperature_plot
+
+def render_slice_png(path, x, y, temps, t_amb, plane, xlims, ylims,
+                     figsize=(6, 6), dpi=150):
+    """把一张温度切片渲染成PNG
+
+    每次调用构建独立的Figure/Agg画布，不触碰任何全局状态，
+    可以安全地在多个线程中同时执行。
+    """
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    im = draw_temperature_plot(ax, x, y, temps, t_amb, plane, xlims, ylims)
+    fig.colorbar(im, ax=ax, label='温度 (°C)')
+    fig.savefig(path)
+    return path
+
+def render_batch(jobs, max_workers=None):
+    """并行渲染一批温度切片
+
+    jobs是render_slice_png参数元组的可迭代对象；返回生成文件
+    路径的列表，顺序与输入一致。
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda job: render_slice_png(*job), jobs))
@@ -0,0 +1,75 @@
+"""温度模型的性能基准
+
+独立于temperature_model，避免计时工具和JIT预热逻辑拖慢GUI的模块
+导入；直接运行本文件即可测试。
+"""
+import os
+import sys
+import time
+
+# 直接运行本文件时没有父包，仿照main.py补路径后改用绝对导入；
+# 不经过包的__init__，避免引入Tk相关模块
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from temperature_model import calculate_slice_temperature, _slice_temperature_cached
+else:
+    from .temperature_model import calculate_slice_temperature, _slice_temperature_cached
+
+def run_performance_test():
+    """运行性能测试"""
+    print("开始性能测试...")
+
+    # 测试参数设置
+    container_size = [0.3, 0.2, 0.2]  # 容器尺寸(m)
+    power = 15  # 功率(W)
+    t_amb = 25  # 环境温度(°C)
+    bulb_pos = [0.15, 0.1, 0.1]  # 灯泡位置
+    wall_thickness = 0.001  # 壁厚(m)
+    materials = ['PP', 'PP', 'PP', 'PP', 'PP', 'PP']  # 默认全部使用PP材料
+
+    # 创建测试点网格
+    plane = "XY"
+    pos = [0, 0, 0.1]
+
+    # 预热JIT编译
+    print("预热JIT编译...")
+    _ = calculate_slice_temperature(
+        plane, pos, container_size, power, t_amb,
+        bulb_pos, wall_thickness,
+        *materials,  # 解包材料列表
+        has_shade=False,
+        shade_height=0.0, shade_angle_h=0.0, shade_angle_v=0.0,
+        shade_top_radius=0.0, shade_bottom_radius=0.0
+    )
+
+    # 性能测试
+    print("执行计算时间测试...")
+    iterations = 5
+    times = []
+
+    for i in range(iterations):
+        # 清掉切片结果缓存：不清的话每轮都命中lru_cache，
+        # 测到的只是字典查找而不是计算内核
+        _slice_temperature_cached.cache_clear()
+        start_time = time.perf_counter()
+        coords, temps = calculate_slice_temperature(
+            plane, pos, container_size, power, t_amb,
+            bulb_pos, wall_thickness,
+            *materials,  # 解包材料列表
+            has_shade=False,
+            shade_height=0.0, shade_angle_h=0.0, shade_angle_v=0.0,
+            shade_top_radius=0.0, shade_bottom_radius=0.0
+        )
+        end_time = time.perf_counter()
+        times.append(end_time - start_time)
+        print(f"迭代 {i+1}: {times[-1]:.3f} 秒")
+
+    avg_time = sum(times) / len(times)
+    print(f"\n平均计算时间: {avg_time:.3f} 秒")
+    print(f"最快时间: {min(times):.3f} 秒")
+    print(f"最慢时间: {max(times):.3f} 秒")
+
+    return avg_time
+
+if __name__ == "__main__":
+    run_performance_test()
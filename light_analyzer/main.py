@@ -12,6 +12,7 @@ Light Analyzer主程序
 import os
 import sys
 import atexit
+import threading
 
 # 如果是直接运行此文件，添加父目录到Python路径
 if __name__ == "__main__":
@@ -31,8 +32,9 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 
 # 导入自定义模块
-from .temperature_model import WALL_THICKNESS, MATERIAL_PROPERTIES, calculate_slice_temperature
-from .visualization import draw_container, draw_temperature_plot
+from .temperature_model import WALL_THICKNESS, MATERIAL_PROPERTIES, calculate_slice_temperature, warmup
+from ._viz_kernels import prepare_field
+from .visualization import draw_container, TemperatureView
 from .ui_windows import ContainerSettingsWindow, LightSettingsWindow, ValueAdjuster
 
 def cleanup():
@@ -59,9 +61,13 @@ class ContainerAnalyzer(tk.Tk):
         plt.rcParams['font.sans-serif'] = ['SimHei']
         plt.rcParams['axes.unicode_minus'] = False
 
+        # 后台预热Numba内核：把秒级的JIT冷启动从首次交互计算
+        # 挪到启动期并行完成
+        threading.Thread(target=self._warmup_kernels, daemon=True).start()
+
         # 初始化参数
         self.init_parameters()
-        
+
         # 创建界面
         self.create_interface()
         
@@ -69,6 +75,19 @@ class ContainerAnalyzer(tk.Tk):
         self.initialize_grid()
         self.update_plot()
 
+    def _warmup_kernels(self):
+        """在后台线程触发Numba内核编译
+
+        先预热GUI刷新路径最先用到的prepare_field，再预热批量计算
+        内核（见temperature_model.warmup）。预热失败不影响功能，
+        首次真正计算时再即时编译。
+        """
+        try:
+            prepare_field(np.zeros((2, 2)), 25.0)
+            warmup()
+        except Exception:
+            pass
+
     def init_parameters(self):
         """初始化所有参数"""
         # 容器参数
@@ -90,6 +109,9 @@ class ContainerAnalyzer(tk.Tk):
         self.power_var = tk.DoubleVar(value=15)
         self.temp_var = tk.DoubleVar(value=20)
         
+        # 壁面掩码缓存，按(形状, 剖切面)记忆
+        self._wall_mask_cache = {}
+
         # 剖切面参数
         self.plane_var = tk.StringVar(value="XY")
         self.x_slice_var = tk.DoubleVar(value=30)
@@ -185,9 +207,17 @@ class ContainerAnalyzer(tk.Tk):
         
         self.container_ax = self.fig.add_axes(container_pos, projection='3d')
         self.temp_ax = self.fig.add_axes(self.temp_pos)
+
+        # 颜色条axes只创建一次，更新时仅刷新映射
+        self.cbar_ax = self.fig.add_axes([0.92, 0.15, 0.02, 0.7])
+        self.cbar = None
         
         # 将matplotlib图形嵌入tkinter窗口
         self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
+        # 温度子图走blit刷新，连续拖动时跳过坐标轴和标题的重绘
+        self.temp_view = TemperatureView(self.canvas, self.temp_ax)
+        # 容器视图的输入快照，没变化时跳过3D重绘
+        self._container_state = None
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
@@ -224,28 +254,36 @@ class ContainerAnalyzer(tk.Tk):
                 self.z_slice_var.get() / 100
             ])
             
-            # 更新3D容器视图
-            draw_container(
-                self.container_ax,
-                self.container_size,
-                self.face_materials['front'],
-                self.face_materials['back'],
-                self.face_materials['left'],
-                self.face_materials['right'],
-                self.face_materials['top'],
-                self.face_materials['bottom'],
-                self.hole_params,
-                self.bulb_pos,
+            # 更新3D容器视图：输入没变（例如只动了功率/环温）就跳过
+            container_state = (
+                tuple(self.container_size),
+                dict(self.face_materials),
+                dict(self.hole_params) if self.hole_params else None,
+                tuple(self.bulb_pos) if self.bulb_pos is not None else None,
                 self.has_shade,
-                self.shade_params,
+                dict(self.shade_params) if self.shade_params else None,
                 self.plane_var.get(),
-                slice_pos
+                tuple(slice_pos),
             )
-            
-            # 移除旧的colorbar
-            for cbar in self.fig.get_axes():
-                if cbar.get_label() == 'colorbar':
-                    self.fig.delaxes(cbar)
+            container_dirty = container_state != self._container_state
+            if container_dirty:
+                draw_container(
+                    self.container_ax,
+                    self.container_size,
+                    self.face_materials['front'],
+                    self.face_materials['back'],
+                    self.face_materials['left'],
+                    self.face_materials['right'],
+                    self.face_materials['top'],
+                    self.face_materials['bottom'],
+                    self.hole_params,
+                    self.bulb_pos,
+                    self.has_shade,
+                    self.shade_params,
+                    self.plane_var.get(),
+                    slice_pos
+                )
+                self._container_state = container_state
             
             # 计算温度分布
             coords, temps = calculate_slice_temperature(
@@ -289,15 +327,17 @@ class ContainerAnalyzer(tk.Tk):
                 xlims = (0, self.container_size[0])
                 ylims = (0, self.container_size[2])
             
-            # 限制温度显示范围
-            temps = np.clip(temps,
-                          self.temp_var.get() - 10,  # 最低显示到环境温度-10°C
-                          self.temp_var.get() + 50)  # 最高显示到环境温度+50°C
+            # 限制温度显示范围（原位裁剪，不分配新数组）
+            np.clip(temps,
+                    self.temp_var.get() - 10,  # 最低显示到环境温度-10°C
+                    self.temp_var.get() + 50,  # 最高显示到环境温度+50°C
+                    out=temps)
             
-            # 绘制温度分布图
-            im = draw_temperature_plot(
-                self.temp_ax,
-                coords,
+            # 绘制温度分布图：切片坐标本来就是两个一维向量，直接传入
+            x_axis, y_axis = coords
+            im, blitted = self.temp_view.draw(
+                x_axis.ravel(),
+                y_axis.ravel(),
                 temps,
                 self.temp_var.get(),
                 self.plane_var.get(),
@@ -305,17 +345,20 @@ class ContainerAnalyzer(tk.Tk):
                 ylims
             )
             
-            # 添加颜色条
-            cax = self.fig.add_axes([0.92, 0.15, 0.02, 0.7])
-            cbar = self.fig.colorbar(im, cax=cax)
-            cbar.set_label('温度 (°C)')
-            cbar.ax.set_label('colorbar')
-            
+            # 更新颜色条（首次创建，之后只刷新映射）
+            if self.cbar is None:
+                self.cbar = self.fig.colorbar(im, cax=self.cbar_ax)
+                self.cbar.set_label('温度 (°C)')
+            else:
+                self.cbar.update_normal(im)
+
             # 重置温度图的位置和大小
             self.temp_ax.set_position(self.temp_pos)
-            
-            # 更新canvas
-            self.canvas.draw_idle()
+
+            # 更新canvas：blit快路径已经把温度图贴上屏幕，
+            # 只有3D视图或静态装饰变化时才需要整图重绘
+            if container_dirty or not blitted:
+                self.canvas.draw_idle()
             
             # 计算并显示温度统计信息
             wall_mask = self.get_wall_mask(temps.shape)
@@ -331,9 +374,14 @@ class ContainerAnalyzer(tk.Tk):
             self.info_label.config(text="更新图形时出错，请检查参数设置")
     
     def get_wall_mask(self, shape):
-        """获取壁面温度点的掩码"""
+        """获取壁面温度点的掩码（按(形状, 剖切面)缓存）"""
+        key = (shape, self.plane_var.get())
+        cached = self._wall_mask_cache.get(key)
+        if cached is not None:
+            return cached
+
         wall_mask = np.zeros(shape, dtype=bool)
-        
+
         if self.plane_var.get() == "XY":
             wall_mask[0,:] = True  # 前壁
             wall_mask[-1,:] = True  # 后壁
@@ -349,7 +397,8 @@ class ContainerAnalyzer(tk.Tk):
             wall_mask[:,-1] = True  # 顶面
             wall_mask[0,:] = True  # 左壁
             wall_mask[-1,:] = True  # 右壁
-        
+
+        self._wall_mask_cache[key] = wall_mask
         return wall_mask
     
     def update_temperature_info(self, wall_temps, inner_temps):
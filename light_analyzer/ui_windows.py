@@ -1,13 +1,28 @@
+import functools
+import math
 import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.patches
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 from .temperature_model import MATERIAL_PROPERTIES
 
+# matplotlib导入约需1秒，只有灯具预览窗口用得到，
+# 推迟到LightSettingsWindow首次打开时再加载
+Figure = None
+FigureCanvasTkAgg = None
+Poly3DCollection = None
+
+def _import_matplotlib():
+    """按需导入matplotlib的预览窗口依赖（只执行一次）"""
+    global Figure, FigureCanvasTkAgg, Poly3DCollection
+    if Figure is None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+# 模块加载时缓存材料键和中文名，下拉框和trace回调不必反复重建
+_MATERIAL_KEYS = list(MATERIAL_PROPERTIES.keys())
+_MATERIAL_NAMES = {k: v['name'] for k, v in MATERIAL_PROPERTIES.items()}
+
 class ValueAdjuster(ttk.Frame):
     """数值调节控件，组合了Spinbox和Scale"""
     def __init__(self, parent, text, variable, from_, to, increment=0.1, decimal_places=1, **kwargs):
@@ -17,14 +32,16 @@ class ValueAdjuster(ttk.Frame):
         self.decimal_places = decimal_places
         ttk.Label(self, text=text).pack(side=tk.LEFT)
         
-        # 创建输入框
+        # 创建输入框：走textvariable，更新显示只要一次变量写入，
+        # 不用delete+insert两次控件调用
+        self._display_var = tk.StringVar()
         self.entry = ttk.Entry(
             self,
+            textvariable=self._display_var,
             width=8,
             justify='right'
         )
         self.entry.pack(side=tk.LEFT, padx=2)
-        self.entry.insert(0, f"{variable.get():.{decimal_places}f}")
         
         # 创建Scale
         self.scale = ttk.Scale(
@@ -52,34 +69,43 @@ class ValueAdjuster(ttk.Frame):
             self.decimal_places = 1  # 一位小数
         elif "壁厚" in text:
             self.decimal_places = 2  # 两位小数
-        
+
+        # 缓存格式串，避免每次更新重新解析f-string里的精度段
+        self._fmt = "{{:.{}f}}".format(self.decimal_places)
+
         # 更新显示的值
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, f"{self.variable.get():.{self.decimal_places}f}")
+        self._display_var.set(self._fmt.format(self.variable.get()))
     
     def _on_scale_change(self, value):
-        """处理Scale值变化"""
-        value = float(self.scale.get())
-        self.variable.set(value)
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, f"{value:.{self.decimal_places}f}")
-    
+        """处理Scale值变化
+
+        Scale通过variable=绑定已经写入了变量，这里再set一次会让
+        同一次拖动触发两轮trace回调，所以只刷新输入框显示。
+        """
+        self._display_var.set(self._fmt.format(float(value)))
+
     def _on_entry_change(self, event=None):
         """处理输入框值变化"""
         try:
-            value = float(self.entry.get())
+            value = float(self._display_var.get())
             if self.scale['from'] <= value <= self.scale['to']:
-                self.variable.set(value)
-                self.entry.delete(0, tk.END)
-                self.entry.insert(0, f"{value:.{self.decimal_places}f}")
+                # 值没变时不重复写变量，避免多余的trace
+                if value != self.variable.get():
+                    self.variable.set(value)
+                self._display_var.set(self._fmt.format(value))
             else:
-                self.entry.delete(0, tk.END)
-                self.entry.insert(0, f"{self.variable.get():.{self.decimal_places}f}")
+                self._display_var.set(self._fmt.format(self.variable.get()))
         except ValueError:
-            self.entry.delete(0, tk.END)
-            self.entry.insert(0, f"{self.variable.get():.{self.decimal_places}f}")
+            self._display_var.set(self._fmt.format(self.variable.get()))
 
 class ContainerSettingsWindow(tk.Toplevel):
+    # 中英文面名称映射及其逆映射，类级常量避免每次打开窗口重建
+    FACE_MAPPING = {
+        "前面": "front", "后面": "back", "左面": "left",
+        "右面": "right", "顶面": "top", "底面": "bottom"
+    }
+    FACE_MAPPING_INV = {en: cn for cn, en in FACE_MAPPING.items()}
+
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
@@ -118,31 +144,28 @@ class ContainerSettingsWindow(tk.Toplevel):
         heat_frame = ttk.LabelFrame(self, text="导热面选择")
         heat_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        # 导热面变量
-        self.face_mapping = {
-            "前面": "front", "后面": "back", "左面": "left",
-            "右面": "right", "顶面": "top", "底面": "bottom"
-        }
-
         # 从父窗口获取当前材料状态
         self.face_materials = {}
-        for name, eng_name in self.face_mapping.items():
+        for name, eng_name in self.FACE_MAPPING.items():
             material = parent.face_materials.get(eng_name, 'PP')
             self.face_materials[name] = tk.StringVar(value=material)
 
-        # 创建材料选择框
-        for face, var in self.face_materials.items():
-            frame = ttk.Frame(heat_frame)
-            frame.pack(fill=tk.X, padx=5, pady=2)
-            ttk.Label(frame, text=f"{face}:").pack(side=tk.LEFT)
-            material_combo = ttk.Combobox(frame, textvariable=var,
-                                        values=list(MATERIAL_PROPERTIES.keys()),
+        # 创建材料选择框：六行直接grid进heat_frame，
+        # 省掉每行一个包装Frame
+        self._material_labels = {}
+        for row, (face, var) in enumerate(self.face_materials.items()):
+            ttk.Label(heat_frame, text=f"{face}:").grid(
+                row=row, column=0, sticky=tk.W, padx=5, pady=2)
+            material_combo = ttk.Combobox(heat_frame, textvariable=var,
+                                        values=_MATERIAL_KEYS,
                                         width=15, state="readonly")
-            material_combo.pack(side=tk.LEFT, padx=5)
-            ttk.Label(frame, text=MATERIAL_PROPERTIES[var.get()]['name']).pack(side=tk.LEFT)
-            # 绑定更新事件
-            var.trace_add("write", lambda *args, f=face, l=frame.winfo_children()[-1]:
-                         l.config(text=MATERIAL_PROPERTIES[self.face_materials[f].get()]['name']))
+            material_combo.grid(row=row, column=1, padx=5, pady=2)
+            name_label = ttk.Label(heat_frame,
+                                   text=_MATERIAL_NAMES[var.get()])
+            name_label.grid(row=row, column=2, sticky=tk.W, pady=2)
+            self._material_labels[face] = name_label
+            # 绑定更新事件：统一走同一个绑定方法，不再每面造一个闭包
+            var.trace_add("write", functools.partial(self._on_material_change, face))
         
         # 开孔设置frame
         hole_frame = ttk.LabelFrame(self, text="开孔设置")
@@ -163,8 +186,7 @@ class ContainerSettingsWindow(tk.Toplevel):
             self.hole_y_var = tk.DoubleVar(value=parent.hole_params['y'])
             
             # 找到对应的中文面名称
-            face_name = next(cn for cn, en in self.face_mapping.items() 
-                           if en == parent.hole_params['face'])
+            face_name = self.FACE_MAPPING_INV[parent.hole_params['face']]
             self.hole_face_var = tk.StringVar(value=face_name)
             
             if parent.hole_params['type'] == 'circle':
@@ -220,7 +242,7 @@ class ContainerSettingsWindow(tk.Toplevel):
         face_frame = ttk.Frame(hole_pos_frame)
         face_frame.pack(fill=tk.X, pady=2)
         ttk.Label(face_frame, text="位于:").pack(side=tk.LEFT)
-        faces = list(self.face_mapping.keys())
+        faces = list(self.FACE_MAPPING.keys())
         face_combo = ttk.Combobox(face_frame, textvariable=self.hole_face_var, 
                                 values=faces, width=10, state="readonly")
         face_combo.pack(side=tk.LEFT, padx=5)
@@ -246,6 +268,11 @@ class ContainerSettingsWindow(tk.Toplevel):
         self.hole_type_var.trace_add("write", self.update_hole_ui)
         self.update_hole_ui()
         
+    def _on_material_change(self, face, *args):
+        """材料选择变化时刷新对应面的材料名称标签"""
+        material = self.face_materials[face].get()
+        self._material_labels[face].config(text=_MATERIAL_NAMES[material])
+
     def update_hole_ui(self, *args):
         """根据开孔类型更新UI"""
         hole_type = self.hole_type_var.get()
@@ -262,6 +289,10 @@ class ContainerSettingsWindow(tk.Toplevel):
     
     def apply_changes(self):
         """应用更改到主窗口"""
+        # 记录旧的网格相关参数，尺寸和壁厚没变时不必重建网格
+        old_size = self.parent.container_size
+        old_thickness = self.parent.wall_thickness
+
         # 更新容器尺寸
         self.parent.container_size = (
             self.length_var.get() / 100,  # 转换为米
@@ -272,7 +303,7 @@ class ContainerSettingsWindow(tk.Toplevel):
         
         # 更新导热面设置
         self.parent.face_materials = {
-            self.face_mapping[face]: var.get()
+            self.FACE_MAPPING[face]: var.get()
             for face, var in self.face_materials.items()
         }
         
@@ -285,7 +316,7 @@ class ContainerSettingsWindow(tk.Toplevel):
                 'type': hole_type,
                 'x': self.hole_x_var.get(),
                 'y': self.hole_y_var.get(),
-                'face': self.face_mapping[self.hole_face_var.get()]
+                'face': self.FACE_MAPPING[self.hole_face_var.get()]
             }
             if hole_type == "circle":
                 self.parent.hole_params['diameter'] = self.hole_diameter_var.get()
@@ -293,14 +324,50 @@ class ContainerSettingsWindow(tk.Toplevel):
                 self.parent.hole_params['width'] = self.hole_width_var.get()
                 self.parent.hole_params['height'] = self.hole_height_var.get()
         
-        # 更新主窗口
-        self.parent.initialize_grid()
+        # 更新主窗口：只有网格相关参数变化时才重建网格，
+        # 仅改材料/开孔时刷新绘图即可
+        grid_dirty = (tuple(old_size) != tuple(self.parent.container_size)
+                      or old_thickness != self.parent.wall_thickness)
+        if grid_dirty:
+            self.parent.initialize_grid()
         self.parent.update_plot()
         self.destroy()
 
+@functools.lru_cache(maxsize=8)
+def _container_verts(L, W, H):
+    """容器六个面的(6,4,3)顶点数组，按尺寸缓存
+
+    预览窗口反复重建背景时尺寸往往没变，缓存命中即零分配；
+    返回的数组身份不变，也能走set_verts的快路径。
+    """
+    return np.array([
+        [[0,0,0], [L,0,0], [L,W,0], [0,W,0]],  # 底面
+        [[0,0,H], [L,0,H], [L,W,H], [0,W,H]],  # 顶面
+        [[0,0,0], [L,0,0], [L,0,H], [0,0,H]],  # 前面
+        [[0,W,0], [L,W,0], [L,W,H], [0,W,H]],  # 后面
+        [[0,0,0], [0,W,0], [0,W,H], [0,0,H]],  # 左面
+        [[L,0,0], [L,W,0], [L,W,H], [L,0,H]]   # 右面
+    ], dtype=np.float64)
+
+def _build_shade_quads(X, Y, Z):
+    """把曲面网格坐标拼成(n,4,3)的四边形顶点数组
+
+    相邻网格点两两组合成四边形，等价于plot_surface内部的分片，
+    但结果可以直接喂给同一个Poly3DCollection的set_verts。
+    2×2窗口通过sliding_window_view以零拷贝视图取出，四个角点
+    一次花式索引聚齐，省掉四份偏移切片的堆叠。
+    """
+    pts = np.stack([X, Y, Z], axis=-1)
+    w = np.lib.stride_tricks.sliding_window_view(pts, (2, 2, 3)).squeeze(2)
+    quads = w[..., [0, 1, 1, 0], [0, 0, 1, 1], :]  # 逆时针四角
+    return quads.reshape(-1, 4, 3)
+
 class LightSettingsWindow(tk.Toplevel):
     def __init__(self, parent):
+        _import_matplotlib()
         super().__init__(parent)
+        # 构造期间控件初始化会触发变量trace，先屏蔽预览重绘
+        self._initializing = True
         self.parent = parent
         self.title("灯具参数设置")
         self.geometry("800x600")
@@ -316,8 +383,9 @@ class LightSettingsWindow(tk.Toplevel):
         preview_frame = ttk.LabelFrame(right_frame, text="预览")
         preview_frame.pack(fill=tk.BOTH, expand=True)
         
-        # 创建matplotlib图形
-        self.fig = plt.figure(figsize=(7, 7))
+        # 创建matplotlib图形：直接用Figure，不经过pyplot，
+        # 否则每次打开窗口都会在Gcf里留一个无法回收的figure
+        self.fig = Figure(figsize=(7, 7))
         self.ax = self.fig.add_subplot(111, projection='3d')
         
         # 调整子图位置以充分利用空间
@@ -325,7 +393,37 @@ class LightSettingsWindow(tk.Toplevel):
         self.canvas = FigureCanvasTkAgg(self.fig, master=preview_frame)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
+
+        # blit背景缓存与动态artist：容器和坐标轴只画一次，
+        # 拖动滑块时仅重绘灯泡/灯罩再贴回位图背景
+        self._bg = None
+        self._bg_size = None
+        self._container_coll = None
+        self._shade_coll = None
+        self._redraw_job = None
+        self._in_static_draw = False
+        # 任何完整绘制（含窗口缩放）之后重新缓存静态背景
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        # 单点用带marker的Line3D比scatter的Path3DCollection轻得多
+        (self._bulb,) = self.ax.plot([0], [0], [0], 'o', color='yellow',
+                                     markersize=10, animated=True)
+
+        # 灯罩网格的两档分辨率：拖动滑块时用低档粗网格，松开鼠标后
+        # 补一次高档精绘；theta的正余弦表只算一次
+        self._cos_hi = np.cos(np.linspace(0, 2*np.pi, 100))
+        self._sin_hi = np.sin(np.linspace(0, 2*np.pi, 100))
+        self._cos_lo = np.cos(np.linspace(0, 2*np.pi, 32))
+        self._sin_lo = np.sin(np.linspace(0, 2*np.pi, 32))
+        self._interactive = False
+        # 两档网格各配一组(R, X, Y, Z)缓冲，重绘全程用out=写入，
+        # 每帧不再分配坐标临时数组
+        self._buf_lo = (np.empty((16, 1)), np.empty((16, 32)),
+                        np.empty((16, 32)), np.empty((16, 32)))
+        self._buf_hi = (np.empty((40, 1)), np.empty((40, 100)),
+                        np.empty((40, 100)), np.empty((40, 100)))
+        # Toplevel上的绑定会作用于窗口内所有控件
+        self.bind('<ButtonRelease-1>', self._on_mouse_release)
+
         # 从父窗口获取当前值
         self.x_pos_var = tk.DoubleVar(value=parent.bulb_pos[0] * 100)  # 米转厘米
         self.y_pos_var = tk.DoubleVar(value=parent.bulb_pos[1] * 100)  # 米转厘米
@@ -404,113 +502,174 @@ class LightSettingsWindow(tk.Toplevel):
         ttk.Button(left_frame, text="应用更改", 
                   command=self.apply_changes).pack(pady=10)
         
-        # 绑定事件
+        # 绑定事件：八个变量的trace统一汇聚到延迟重绘
         for var in [self.x_pos_var, self.y_pos_var,
-                   self.power_var, self.top_radius_var, 
-                   self.bottom_radius_var, self.height_var, 
+                   self.power_var, self.top_radius_var,
+                   self.bottom_radius_var, self.height_var,
                    self.angle_h_var, self.angle_v_var,
                    self.has_shade_var]:
-            var.trace_add("write", self.update_preview)
+            var.trace_add("write", self._schedule_preview)
             
         self.has_shade_var.trace_add("write", self.update_shade_ui)
         
-        # 初始化UI状态
+        # 初始化UI状态：构造完成后只做一次首帧绘制
+        self._initializing = False
         self.update_shade_ui()
         self.update_preview()
     
-    def update_preview(self, *args):
-        """更新预览图"""
-        self.ax.clear()
-        
-        # 绘制容器轮廓（半透明）
+    def _on_draw(self, event):
+        """完整绘制后重新缓存静态背景
+
+        窗口缩放会让后端自行做一次完整绘制，缓存的旧位图尺寸随之
+        失效；和TemperatureView一样挂在draw_event上重新抓取。
+        animated的灯泡/灯罩不参与完整绘制，这里再排一次blit把
+        它们贴回去。
+        """
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._bg_size = tuple(self.parent.container_size)
+        if (not self._in_static_draw and not self._initializing
+                and self._redraw_job is None):
+            self._redraw_job = self.after_idle(self.update_preview)
+
+    def _draw_static_background(self):
+        """绘制一次静态场景（容器轮廓和坐标轴）并缓存位图背景"""
+        # 绘制容器轮廓（半透明）：六个面放进同一个Poly3DCollection，
+        # 顶点直接用(6,4,3)的ndarray，避免六个独立artist和嵌套list装箱
         L, W, H = self.parent.container_size
-        vertices = [
-            [[0,0,0], [L,0,0], [L,W,0], [0,W,0]],  # 底面
-            [[0,0,H], [L,0,H], [L,W,H], [0,W,H]],  # 顶面
-            [[0,0,0], [L,0,0], [L,0,H], [0,0,H]],  # 前面
-            [[0,W,0], [L,W,0], [L,W,H], [0,W,H]],  # 后面
-            [[0,0,0], [0,W,0], [0,W,H], [0,0,H]],  # 左面
-            [[L,0,0], [L,W,0], [L,W,H], [L,0,H]]   # 右面
-        ]
-        
-        for verts in vertices:
-            self.ax.add_collection3d(Poly3DCollection([verts], alpha=0.1, color='gray'))
-        
-        # 绘制灯泡位置
-        x = self.x_pos_var.get() / 100  # 厘米转米
-        y = self.y_pos_var.get() / 100
-        z = H  # 顶部固定
-        self.ax.scatter([x], [y], [z], color='yellow', s=100)
-        
-        # 绘制灯罩
-        if self.has_shade_var.get():
-            try:
-                theta = np.linspace(0, 2*np.pi, 100)  # 增加分段数使灯罩更圆滑
-                height = self.height_var.get() / 100
-                z_shade = np.linspace(H - height, H, 40)
-                Theta, Z = np.meshgrid(theta, z_shade)
-                
-                # 计算灯罩的半径（随高度线性变化）
-                top_r = self.top_radius_var.get() / 100
-                bottom_r = self.bottom_radius_var.get() / 100
-                R = top_r + (bottom_r - top_r) * (H - Z) / height
-                
-                # 生成圆柱体基础坐标
-                X = R * np.cos(Theta)
-                Y = R * np.sin(Theta)
-                Z = Z - H  # 相对高度
-
-                # 获取角度
-                angle_h = np.radians(float(self.angle_h_var.get()))
-                angle_v = np.radians(float(self.angle_v_var.get()))
-
-                # 先进行垂直倾斜（绕X轴旋转）
-                Y_temp = Y * np.cos(angle_v) - Z * np.sin(angle_v)
-                Z_temp = Y * np.sin(angle_v) + Z * np.cos(angle_v)
-
-                # 再进行水平旋转（绕Z轴旋转）
-                X_rot = X * np.cos(angle_h) - Y_temp * np.sin(angle_h)
-                Y_rot = X * np.sin(angle_h) + Y_temp * np.cos(angle_h)
-                Z_rot = Z_temp
-                
-                # 将坐标移回灯泡位置
-                X_rot = x + X_rot
-                Y_rot = y + Y_rot
-                Z_rot = H + Z_rot
-                
-                self.ax.plot_surface(X_rot, Y_rot, Z_rot, alpha=0.3, color='gray')
-            except Exception as e:
-                print("灯罩绘制错误:", str(e))
-        
+        vertices = _container_verts(L, W, H)
+        if self._container_coll is None:
+            self._container_coll = Poly3DCollection(vertices, alpha=0.1,
+                                                    color='gray')
+            self.ax.add_collection3d(self._container_coll)
+        else:
+            self._container_coll.set_verts(vertices)
+
         # 设置视图
         self.ax.set_xlabel('X (m)')
         self.ax.set_ylabel('Y (m)')
         self.ax.set_zlabel('Z (m)')
-        
+
         # 设置容器显示比例和范围
         max_dim = max(L, W, H)
         margin = max_dim * 0.1  # 10%的边距
-        
+
         # 设置相等的坐标轴比例
         self.ax.set_box_aspect((L/max_dim, W/max_dim, H/max_dim))
-        
+
         # 设置固定的刻度位置
-        x_ticks = np.linspace(0, L, 4)  # 3等分
-        y_ticks = np.linspace(0, W, 3)  # 2等分
-        z_ticks = np.linspace(0, H, 3)  # 2等分
-        
-        self.ax.set_xticks(x_ticks)
-        self.ax.set_yticks(y_ticks)
-        self.ax.set_zticks(z_ticks)
-        
+        self.ax.set_xticks(np.linspace(0, L, 4))  # 3等分
+        self.ax.set_yticks(np.linspace(0, W, 3))  # 2等分
+        self.ax.set_zticks(np.linspace(0, H, 3))  # 2等分
+
         # 设置坐标轴范围
         self.ax.set_xlim(-margin, L + margin)
         self.ax.set_ylim(-margin, W + margin)
         self.ax.set_zlim(-margin, H + margin)
         self.ax.view_init(elev=20, azim=45)
-        
-        # 刷新画布
-        self.canvas.draw()
+
+        # 动态artist标记为animated后不参与本次draw，背景即纯静态
+        # 场景；位图由draw_event回调统一缓存
+        self._in_static_draw = True
+        try:
+            self.canvas.draw()
+        finally:
+            self._in_static_draw = False
+
+    def _schedule_preview(self, *args):
+        """合并一次拖动中的连续trace：只保留约30FPS的尾随重绘"""
+        if self._initializing:
+            return
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+        self._interactive = True
+        self._redraw_job = self.after(33, self.update_preview)
+
+    def _on_mouse_release(self, event=None):
+        """拖动结束：切回高分辨率灯罩网格补一次精绘"""
+        if self._interactive:
+            self._interactive = False
+            if self._redraw_job is not None:
+                self.after_cancel(self._redraw_job)
+            self._redraw_job = self.after(33, self.update_preview)
+
+    def update_preview(self, *args):
+        """更新预览图（恢复静态背景后仅重绘灯泡/灯罩并blit）"""
+        self._redraw_job = None
+        # 静态场景只跟容器尺寸有关，尺寸没变就复用缓存的背景
+        if self._bg is None or self._bg_size != tuple(self.parent.container_size):
+            self._draw_static_background()
+        self.canvas.restore_region(self._bg)
+
+        L, W, H = self.parent.container_size
+
+        # 绘制灯泡位置
+        x = self.x_pos_var.get() / 100  # 厘米转米
+        y = self.y_pos_var.get() / 100
+        z = H  # 顶部固定
+        self._bulb.set_data_3d([x], [y], [z])
+        self.ax.draw_artist(self._bulb)
+
+        # 绘制灯罩：复用同一个Poly3DCollection，每帧只更新顶点，
+        # 避免plot_surface每次重建几千个四边形的artist
+        if self.has_shade_var.get():
+            try:
+                # 拖动时降档到32×16的粗网格，足够预览；松开后是100×40
+                if self._interactive:
+                    cos_t, sin_t = self._cos_lo, self._sin_lo
+                    R, X, Y, Z = self._buf_lo
+                else:
+                    cos_t, sin_t = self._cos_hi, self._sin_hi
+                    R, X, Y, Z = self._buf_hi
+                height = self.height_var.get() / 100
+                z_shade = np.linspace(H - height, H, R.shape[0])[:, None]
+
+                # 计算灯罩的半径（随高度线性变化）：
+                # R = top_r + (bottom_r - top_r) * (H - z) / height
+                top_r = self.top_radius_var.get() / 100
+                bottom_r = self.bottom_radius_var.get() / 100
+                np.subtract(H, z_shade, out=R)
+                R *= (bottom_r - top_r) / height
+                R += top_r
+
+                # 生成圆柱体基础坐标（广播写入预分配缓冲）
+                np.multiply(R, cos_t[None, :], out=X)
+                np.multiply(R, sin_t[None, :], out=Y)
+                np.subtract(z_shade, H, out=Z)
+
+                # 获取角度，把垂直倾斜（绕X轴）和水平旋转（绕Z轴）
+                # 合成一个3×3矩阵，对堆叠坐标一次matmul完成变换
+                # 标量三角函数用math而不是numpy，便宜两个数量级；
+                # DoubleVar.get()本身就返回float，无需再转
+                angle_h = math.radians(self.angle_h_var.get())
+                angle_v = math.radians(self.angle_v_var.get())
+                ch, sh = math.cos(angle_h), math.sin(angle_h)
+                cv, sv = math.cos(angle_v), math.sin(angle_v)
+                rot = np.array([[ch, -sh * cv, sh * sv],
+                                [sh, ch * cv, -ch * sv],
+                                [0.0, sv, cv]])
+
+                rotated = np.tensordot(rot, np.stack([X, Y, Z]), axes=1)
+                # 一次广播把坐标移回灯泡位置
+                rotated += np.array([x, y, H])[:, None, None]
+                X_rot, Y_rot, Z_rot = rotated
+
+                quads = _build_shade_quads(X_rot, Y_rot, Z_rot)
+                if self._shade_coll is None:
+                    self._shade_coll = Poly3DCollection(quads, alpha=0.3,
+                                                        color='gray')
+                    self._shade_coll.set_animated(True)
+                    self.ax.add_collection3d(self._shade_coll)
+                else:
+                    self._shade_coll.set_verts(quads)
+                self._shade_coll.set_visible(True)
+                self.ax.draw_artist(self._shade_coll)
+            except Exception as e:
+                print("灯罩绘制错误:", str(e))
+        elif self._shade_coll is not None:
+            self._shade_coll.set_visible(False)
+
+        # 把动态元素贴回缓存的背景
+        self.canvas.blit(self.fig.bbox)
     
     def update_shade_ui(self, *args):
         """根据灯罩启用状态更新UI"""
@@ -602,3 +761,11 @@ class LightSettingsWindow(tk.Toplevel):
             self.destroy()
         except Exception as e:
             messagebox.showerror("错误", f"应用更改时出错: {str(e)}")
+
+    def destroy(self):
+        """关闭窗口时清理figure，保证反复开关不累积内存"""
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        self.fig.clf()
+        super().destroy()
@@ -4,136 +4,217 @@
 处理容器和温度分布的3D显示
 """
 
+import functools
+
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from mpl_toolkits.mplot3d.art3d import Line3D, Line3DCollection, Poly3DCollection
 import matplotlib.colors as colors
 import matplotlib.cm as cm
 
+from ._viz_kernels import prepare_field
+
+# 单位立方体六个面的顶点模板，按(底,顶,前,后,左,右)排列；
+# 乘以(l,w,h)即得实际容器面，免去每帧构造嵌套Python列表
+_UNIT_FACES = np.array([
+    [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]],  # 底面
+    [[0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]],  # 顶面
+    [[0, 0, 0], [1, 0, 0], [1, 0, 1], [0, 0, 1]],  # 前面
+    [[0, 1, 0], [1, 1, 0], [1, 1, 1], [0, 1, 1]],  # 后面
+    [[0, 0, 0], [0, 1, 0], [0, 1, 1], [0, 0, 1]],  # 左面
+    [[1, 0, 0], [1, 1, 0], [1, 1, 1], [1, 0, 1]]   # 右面
+], dtype=np.float32)
+
+# 单位立方体的12条棱，和_UNIT_FACES一样按尺寸广播缩放，
+# 全部棱线交给一个Line3DCollection一次投影
+_UNIT_EDGES = np.array([
+    # 底面四条
+    [[0, 0, 0], [1, 0, 0]], [[1, 0, 0], [1, 1, 0]],
+    [[1, 1, 0], [0, 1, 0]], [[0, 1, 0], [0, 0, 0]],
+    # 顶面四条
+    [[0, 0, 1], [1, 0, 1]], [[1, 0, 1], [1, 1, 1]],
+    [[1, 1, 1], [0, 1, 1]], [[0, 1, 1], [0, 0, 1]],
+    # 四条竖棱
+    [[0, 0, 0], [0, 0, 1]], [[1, 0, 0], [1, 0, 1]],
+    [[1, 1, 0], [1, 1, 1]], [[0, 1, 0], [0, 1, 1]]
+], dtype=np.float32)
+
+# 材料面颜色：模块加载时就解析成RGBA，绘制时堆成(k,4)数组一次
+# 提交，免得matplotlib每帧重复解析十六进制串
+_MAT_HEX = {
+    "Glass": "#add8e6",  # 浅蓝色
+    "PP": "#f0f0f0",     # 浅灰色
+    "PE": "#e0e0e0",     # 中灰色
+    "AL": "#c0c0c0"      # 深灰色
+}
+_MAT_RGBA = {name: np.array(colors.to_rgba(hex_color), dtype=np.float32)
+             for name, hex_color in _MAT_HEX.items()}
+_MAT_DEFAULT_RGBA = np.array(colors.to_rgba("#ffffff"), dtype=np.float32)
+
+# 灯罩圆环的正余弦表：纯常量，导入时算一次；和顶点模板一样
+# 存成float32，3D投影阶段的拷贝带宽减半
+_RING_THETA = np.linspace(0, 2*np.pi, 32)
+_RING_COS = np.cos(_RING_THETA).astype(np.float32)
+_RING_SIN = np.sin(_RING_THETA).astype(np.float32)
+
+# matplotlib>=3.8开放了ContourPy的算法选择，serial算法输出相同
+# 但约快一倍；老版本继续走默认的mpl2014
+if tuple(int(p) for p in matplotlib.__version__.split('.')[:2]) >= (3, 8):
+    _CONTOUR_KW = {'algorithm': 'serial'}
+else:
+    _CONTOUR_KW = {}
+
+@functools.lru_cache(maxsize=16)
+def _contour_levels(t_amb):
+    """等温线级别按环境温度缓存
+
+    显示窗口固定为环境温度-10到+50，分24级色带、每4级取一条
+    等温线；环境温度只在整数档位间变化，缓存几乎总是命中。
+    """
+    return np.linspace(t_amb - 10, t_amb + 50, 24)[::4]
+
+def _ensure_container_artists(ax):
+    """惰性创建容器视图的持久artist
+
+    ax.clear()加整图重建是3D交互刷新的最大开销，这里让六个容器面
+    共用一个Poly3DCollection、灯泡用一个散点集，剖切面和灯罩同样
+    各占一个持久artist，后续帧只更新数据或切换可见性。
+    """
+    if getattr(ax, '_container_faces', None) is None:
+        # 面不再各自描边，12条棱统一由一个Line3DCollection绘制
+        ax._container_faces = Poly3DCollection([], alpha=0.3,
+                                               edgecolor='none')
+        ax.add_collection3d(ax._container_faces)
+        # matplotlib>=3.10的add_collection3d会按线段自动缩放坐标轴，
+        # 空集合会直接抛异常，这里先用单位棱线模板占位
+        ax._container_edges = Line3DCollection(_UNIT_EDGES, colors='black',
+                                               linewidths=2)
+        ax.add_collection3d(ax._container_edges)
+        ax._cut_plane = Poly3DCollection([], facecolor='lightblue', alpha=0.4)
+        ax._cut_plane.set_visible(False)
+        ax.add_collection3d(ax._cut_plane)
+        ax._cut_edge = Line3D([], [], [], color='black', linewidth=2)
+        ax._cut_edge.set_visible(False)
+        ax.add_line(ax._cut_edge)
+        ax._bulb_marker = ax.scatter([0], [0], [0], color='yellow',
+                                     s=100, marker='*')
+        ax._container_size = None
+        # 初始视角只设一次，之后保留用户的旋转结果
+        ax.view_init(elev=20, azim=45)
+
 def draw_container(ax, size, front_material, back_material, left_material,
                   right_material, top_material, bottom_material, hole_params,
                   bulb_pos, has_shade, shade_params, cut_plane, slice_pos):
     """绘制容器3D图"""
-    # 清除当前图形
-    ax.clear()
-    
-    # 设置视角
-    ax.view_init(elev=20, azim=45)
-    
-    # 容器顶点坐标
+    _ensure_container_artists(ax)
+
+    # 容器顶点坐标：单位模板一次广播乘出(6,4,3)数组
     l, w, h = size  # 长宽高
-    vertices = [
-        [[0, 0, 0], [l, 0, 0], [l, w, 0], [0, w, 0]],  # 底面
-        [[0, 0, h], [l, 0, h], [l, w, h], [0, w, h]],  # 顶面
-        [[0, 0, 0], [l, 0, 0], [l, 0, h], [0, 0, h]],  # 前面
-        [[0, w, 0], [l, w, 0], [l, w, h], [0, w, h]],  # 后面
-        [[0, 0, 0], [0, w, 0], [0, w, h], [0, 0, h]],  # 左面
-        [[l, 0, 0], [l, w, 0], [l, w, h], [l, 0, h]]   # 右面
-    ]
-    
-    # 设置不同面的颜色和透明度
+    vertices = _UNIT_FACES * np.array([l, w, h], dtype=np.float32)
+
+    # 设置不同面的颜色
     materials = [bottom_material, top_material, front_material,
                 back_material, left_material, right_material]
-    alphas = [0.3] * 6  # 所有面的透明度
 
     # 根据剖切面调整显示
     if cut_plane == "XY":
         if slice_pos[2] < h:
             vertices = vertices[:2]  # 只显示底面和顶面
             materials = materials[:2]
-            alphas = alphas[:2]
     elif cut_plane == "YZ":
         if slice_pos[0] < l:
-            vertices = [vertices[2], vertices[3]]  # 只显示前面和后面
+            vertices = vertices[2:4]  # 只显示前面和后面
             materials = materials[2:4]
-            alphas = alphas[2:4]
     else:  # XZ
         if slice_pos[1] < w:
-            vertices = [vertices[4], vertices[5]]  # 只显示左面和右面
+            vertices = vertices[4:]  # 只显示左面和右面
             materials = materials[4:]
-            alphas = alphas[4:]
-
-    # 设置材料颜色
-    material_colors = {
-        "Glass": "#add8e6",  # 浅蓝色
-        "PP": "#f0f0f0",     # 浅灰色
-        "PE": "#e0e0e0",     # 中灰色
-        "AL": "#c0c0c0"      # 深灰色
-    }
-    face_colors = [material_colors.get(mat, "#ffffff") for mat in materials]
-    
-    # 绘制容器外轮廓和面
-    for face, color, alpha in zip(vertices, face_colors, alphas):
-        # 绘制面
-        poly3d = Poly3DCollection([face])
-        poly3d.set_facecolor(color)
-        poly3d.set_alpha(alpha)
-        poly3d.set_edgecolor('black')  # 添加黑色边框
-        poly3d.set_linewidth(2)  # 加粗边框线条
-        poly3d.set_edgecolor('#000000')  # 使用纯黑色
-        ax.add_collection3d(poly3d)
-
-    # 绘制剖切面及其边缘
+
+    # 设置材料颜色（预解析的RGBA表，一次堆成(k,4)数组）
+    face_colors = np.stack([_MAT_RGBA.get(mat, _MAT_DEFAULT_RGBA)
+                            for mat in materials])
+
+    # 更新容器面：所有面在同一个集合里，一次set_verts完成；
+    # 棱线整批更新，一次投影画完12条
+    ax._container_faces.set_verts(vertices)
+    ax._container_faces.set_facecolor(face_colors)
+
+    # 静态装饰只在容器尺寸变化时重设：set_box_aspect/set_*lim每次
+    # 调用都会把投影矩阵标脏并强制重算
+    if ax._container_size != tuple(size):
+        ax._container_edges.set_segments(
+            _UNIT_EDGES * np.array([l, w, h], dtype=np.float32))
+
+        # 设置视图为等比例
+        ax.set_box_aspect((l/max(l,w,h), w/max(l,w,h), h/max(l,w,h)))
+
+        # 设置坐标轴范围
+        ax.set_xlim(0, l)
+        ax.set_ylim(0, w)
+        ax.set_zlim(0, h)
+
+        # 设置标签
+        ax.set_xlabel('X (m)')
+        ax.set_ylabel('Y (m)')
+        ax.set_zlabel('Z (m)')
+
+        # 设置标题
+        ax.set_title('容器3D视图')
+
+        ax._container_size = tuple(size)
+
+    # 绘制剖切面及其边缘：剖切面就是一个四边形，直接给持久的
+    # Poly3DCollection设顶点，绕开plot_surface的网格细分
+    quad = None
     if cut_plane == "XY":
         z = slice_pos[2]
         if 0 < z < h:
-            xx, yy = np.meshgrid([0, l], [0, w], indexing='ij')
-            zz = np.full_like(xx, z)
-            # 绘制剖切平面（使用更显眼的颜色和透明度）
-            ax.plot_surface(xx, yy, zz, alpha=0.4, color='lightblue')
-            # 绘制剖切面边缘
-            ax.plot([0, l, l, 0, 0], [0, 0, w, w, 0], [z, z, z, z, z], 
-                   color='black', linewidth=2)
+            quad = np.array([[[0, 0, z], [l, 0, z], [l, w, z], [0, w, z]]],
+                            dtype=np.float32)
     elif cut_plane == "YZ":
         x = slice_pos[0]
         if 0 < x < l:
-            yy, zz = np.meshgrid([0, w], [0, h], indexing='ij')
-            xx = np.full_like(yy, x)
-            # 绘制剖切平面（使用更显眼的颜色和透明度）
-            ax.plot_surface(xx, yy, zz, alpha=0.4, color='lightblue')
-            # 绘制剖切面边缘
-            ax.plot([x, x, x, x, x], [0, w, w, 0, 0], [0, 0, h, h, 0], 
-                   color='black', linewidth=2)
+            quad = np.array([[[x, 0, 0], [x, w, 0], [x, w, h], [x, 0, h]]],
+                            dtype=np.float32)
     else:  # XZ
         y = slice_pos[1]
         if 0 < y < w:
-            xx, zz = np.meshgrid([0, l], [0, h], indexing='ij')
-            yy = np.full_like(xx, y)
-            # 绘制剖切平面（使用更显眼的颜色和透明度）
-            ax.plot_surface(xx, yy, zz, alpha=0.4, color='lightblue')
-            # 绘制剖切面边缘
-            ax.plot([0, l, l, 0, 0], [y, y, y, y, y], [0, 0, h, h, 0], 
-                   color='black', linewidth=2)
-
-    # 设置视图为等比例
-    ax.set_box_aspect((l/max(l,w,h), w/max(l,w,h), h/max(l,w,h)))
-    
-    # 绘制灯泡位置
+            quad = np.array([[[0, y, 0], [l, y, 0], [l, y, h], [0, y, h]]],
+                            dtype=np.float32)
+
+    if quad is not None:
+        ax._cut_plane.set_verts(quad)
+        ax._cut_plane.set_visible(True)
+        # 边框线就是四边形轮廓的闭合折线，更新持久的Line3D
+        edge = quad[0][[0, 1, 2, 3, 0]]
+        ax._cut_edge.set_data_3d(edge[:, 0], edge[:, 1], edge[:, 2])
+        ax._cut_edge.set_visible(True)
+    else:
+        ax._cut_plane.set_visible(False)
+        ax._cut_edge.set_visible(False)
+
+    # 更新灯泡位置（持久散点集，仅改偏移）
     if bulb_pos is not None:
-        ax.scatter(*bulb_pos, color='yellow', s=100, marker='*')
-    
-    # 绘制灯罩（如果有）
+        ax._bulb_marker._offsets3d = ([bulb_pos[0]], [bulb_pos[1]],
+                                      [bulb_pos[2]])
+        ax._bulb_marker.set_visible(True)
+    else:
+        ax._bulb_marker.set_visible(False)
+
+    # 绘制灯罩（如果有），关掉时只隐藏持久的灯罩集合
     if has_shade and shade_params:
         draw_shade(ax, bulb_pos, shade_params)
-    
-    # 设置坐标轴范围
-    ax.set_xlim(0, size[0])
-    ax.set_ylim(0, size[1])
-    ax.set_zlim(0, size[2])
-    
-    # 设置标签
-    ax.set_xlabel('X (m)')
-    ax.set_ylabel('Y (m)')
-    ax.set_zlabel('Z (m)')
-    
-    # 设置标题
-    ax.set_title('容器3D视图')
+    elif getattr(ax, '_shade_poly', None) is not None:
+        ax._shade_poly.set_visible(False)
 
 def draw_shade(ax, bulb_pos, shade_params):
     """绘制灯罩"""
-    if not all(key in shade_params for key in 
+    if not all(key in shade_params for key in
               ['height', 'angle_h', 'angle_v', 'top_radius', 'bottom_radius']):
+        if getattr(ax, '_shade_poly', None) is not None:
+            ax._shade_poly.set_visible(False)
         return
     
     # 提取参数
@@ -143,68 +224,159 @@ def draw_shade(ax, bulb_pos, shade_params):
     r_top = shade_params['top_radius']
     r_bottom = shade_params['bottom_radius']
     
-    # 计算灯罩顶部和底部的圆环
-    theta = np.linspace(0, 2*np.pi, 32)
-    
-    # 顶部圆环
-    x_top = bulb_pos[0] + r_top * np.cos(theta)
-    y_top = bulb_pos[1] + r_top * np.sin(theta)
-    z_top = np.full_like(theta, bulb_pos[2])
-    
-    # 底部圆环
-    x_bottom = bulb_pos[0] + r_bottom * np.cos(theta)
-    y_bottom = bulb_pos[1] + r_bottom * np.sin(theta)
-    z_bottom = np.full_like(theta, bulb_pos[2] - height)
-    
-    # 绘制灯罩表面
-    surf_x = np.vstack((x_top, x_bottom))
-    surf_y = np.vstack((y_top, y_bottom))
-    surf_z = np.vstack((z_top, z_bottom))
-    
-    ax.plot_surface(surf_x, surf_y, surf_z, alpha=0.3, color='gray')
+    # 计算灯罩顶部和底部的圆环：半径按(2,1)列向量与模块级
+    # 正余弦表广播，直接得到两行曲面网格，免去vstack拼接
+    radii = np.array([[r_top], [r_bottom]], dtype=np.float32)
+    surf_x = bulb_pos[0] + radii * _RING_COS
+    surf_y = bulb_pos[1] + radii * _RING_SIN
+    surf_z = np.array([[bulb_pos[2]], [bulb_pos[2] - height]],
+                      dtype=np.float32) + np.zeros_like(_RING_COS)
 
-def draw_temperature_plot(ax, coords, temps, t_amb, plane, xlims, ylims):
-    """绘制温度分布图"""
-    # 清除当前图形
-    ax.clear()
-    
-    # 创建网格
-    X, Y = coords  # Unpack the coordinate tuple
-    x = np.unique(X)
-    y = np.unique(Y)
-    X, Y = np.meshgrid(x, y, indexing='ij')
-    Z = temps.reshape((len(x), len(y)))
-    
-    # 创建更平滑的等温线图
-    levels = np.linspace(t_amb - 10, t_amb + 50, 100)  # 增加等温线数量
-    # 使用RdYlBu colormap并添加插值
-    im = ax.contourf(X, Y, Z, levels=levels, cmap='RdYlBu_r', extend='both')
-    
-    # 添加等温线
-    contour = ax.contour(X, Y, Z, levels=levels[::10], colors='black', linewidths=0.5, alpha=0.3)
-    
-    # 使用平滑填充
-    ax.set_rasterization_zorder(-1)  # 确保填充区域在背景
-    
-    # 设置等比例显示
-    ax.set_aspect('equal')
-    
-    # 设置标签
-    if plane == "XY":
-        xlabel, ylabel = 'X (m)', 'Y (m)'
-    elif plane == "YZ":
-        xlabel, ylabel = 'Y (m)', 'Z (m)'
-    else:  # XZ
-        xlabel, ylabel = 'X (m)', 'Z (m)'
-    
-    ax.set_xlabel(xlabel)
-    ax.set_ylabel(ylabel)
-    
-    # 设置标题
-    ax.set_title(f'{plane}平面温度分布')
-    
-    # 设置坐标轴范围
-    ax.set_xlim(xlims)
-    ax.set_ylim(ylims)
-    
+    # 圆台侧面就是31个平面四边形，顶/底环相邻点两两成面；
+    # 复用同一个Poly3DCollection，每帧只更新顶点而不重建artist
+    rings = np.stack([surf_x, surf_y, surf_z], axis=-1)  # (2, 32, 3)
+    quads = np.stack([rings[0, :-1], rings[0, 1:],
+                      rings[1, 1:], rings[1, :-1]], axis=1)
+    if getattr(ax, '_shade_poly', None) is None:
+        ax._shade_poly = Poly3DCollection(quads, facecolor='gray', alpha=0.3)
+        ax.add_collection3d(ax._shade_poly)
+    else:
+        ax._shade_poly.set_verts(quads)
+    ax._shade_poly.set_visible(True)
+
+def draw_temperature_plot(ax, x, y, Z, t_amb, plane, xlims, ylims):
+    """绘制温度分布图
+
+    x、y是切片两个方向的一维坐标，Z是(len(x), len(y))的温度网格。
+    调用方本来就持有网格定义，这里不再用unique/reshape反推。
+    """
+    # 数据和参数都没变时直接复用上次结果：contour是整个刷新路径
+    # 最贵的一步，对温度数组做一次哈希比重新contour便宜几个量级
+    key = (hash(Z.tobytes()), Z.shape, t_amb, plane,
+           tuple(xlims), tuple(ylims))
+    if getattr(ax, '_last_temp_key', None) == key:
+        return ax._last_im
+
+    # 渲染前整理温度场：NaN置为环境温度并收窄到float32，
+    # 一趟并行内核完成（见_viz_kernels）
+    Z = prepare_field(Z, t_amb)
+
+    # 超大网格先按步长抽稀到约256×256：屏幕上每个单元都不足一个
+    # 像素，更高的输入分辨率只是白白增加QuadMesh和contour的开销。
+    # 上游随便提高切片分辨率，这里的绘制成本仍然有界
+    if Z.shape[0] * Z.shape[1] > 65536:
+        stride = int(np.ceil(np.sqrt(Z.size / 65536)))
+        Z = Z[::stride, ::stride]
+        x = x[::stride]
+        y = y[::stride]
+
+    vmin, vmax = t_amb - 10, t_amb + 50
+    grid_key = (Z.shape, plane, tuple(xlims), tuple(ylims))
+
+    if getattr(ax, '_temp_grid_key', None) != grid_key:
+        # 网格或剖切面变了：重建QuadMesh并重设静态装饰
+        ax.clear()
+
+        # 温度色场用pcolormesh：整场只有一个QuadMesh交给渲染器，
+        # 比100层contourf的嵌套多边形路径便宜得多；gouraud插值保持平滑观感
+        # 一维坐标直接传入时matplotlib按(ny, nx)解释数据，转置即可
+        im = ax.pcolormesh(x, y, Z.T, cmap='RdYlBu_r', shading='gouraud',
+                           vmin=vmin, vmax=vmax)
+
+        # 色场显式栅格化并压到栅格化阈值之下：此前只设了阈值但
+        # 没有artist落在阈值以下，保存矢量图时其实什么都没栅格化；
+        # 现在整个色场在矢量后端里压成一张位图，等温线保持矢量
+        im.set_rasterized(True)
+        im.set_zorder(-2)
+        ax.set_rasterization_zorder(-1)
+
+        # 设置等比例显示
+        ax.set_aspect('equal')
+
+        # 设置标签
+        if plane == "XY":
+            xlabel, ylabel = 'X (m)', 'Y (m)'
+        elif plane == "YZ":
+            xlabel, ylabel = 'Y (m)', 'Z (m)'
+        else:  # XZ
+            xlabel, ylabel = 'X (m)', 'Z (m)'
+
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+
+        # 设置标题
+        ax.set_title(f'{plane}平面温度分布')
+
+        # 设置坐标轴范围
+        ax.set_xlim(xlims)
+        ax.set_ylim(ylims)
+
+        ax._temp_mesh = im
+        ax._temp_contour = None
+        ax._temp_grid_key = grid_key
+    else:
+        # 网格没变：就地刷新色场数据，坐标轴和标题原样保留
+        im = ax._temp_mesh
+        im.set_array(Z.T.ravel())
+        im.set_clim(vmin, vmax)
+        if ax._temp_contour is not None:
+            try:
+                ax._temp_contour.remove()
+            except (AttributeError, NotImplementedError):
+                # matplotlib<3.8的ContourSet没有remove，逐个集合清理
+                for coll in ax._temp_contour.collections:
+                    coll.remove()
+
+    # 添加等温线（数据相关，每次重建）
+    ax._temp_contour = ax.contour(x, y, Z.T, levels=_contour_levels(t_amb),
+                                  colors='black', linewidths=0.5, alpha=0.3,
+                                  **_CONTOUR_KW)
+
+    ax._last_temp_key = key
+    ax._last_im = im
     return im
+
+class TemperatureView:
+    """温度子图的blit刷新器
+
+    连续拖动参数时坐标轴、刻度和标题从不变化，重画它们却占了
+    draw_idle的大头。这里在每次完整绘制后缓存子图位图，网格和
+    环境温度都没变的后续刷新只重绘色场与等温线再贴回背景；
+    色场铺满整个数据区，背景里的旧内容会被完全盖住。
+    """
+
+    def __init__(self, canvas, ax):
+        self.canvas = canvas
+        self.ax = ax
+        self._background = None
+        self._view_key = None
+        # 任何完整绘制（含窗口缩放、工具栏操作）之后重新缓存背景
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def draw(self, x, y, Z, t_amb, plane, xlims, ylims):
+        """刷新温度图，返回(色场artist, 是否走了blit快路径)"""
+        ax = self.ax
+        im = draw_temperature_plot(ax, x, y, Z, t_amb, plane, xlims, ylims)
+
+        # 网格重建或环温变化（色标随之变化）都需要一次完整绘制
+        view_key = (getattr(ax, '_temp_grid_key', None), t_amb)
+        can_blit = (self._background is not None
+                    and view_key == self._view_key)
+        self._view_key = view_key
+        if not can_blit:
+            return im, False
+
+        self.canvas.restore_region(self._background)
+        ax.draw_artist(im)
+        contour = ax._temp_contour
+        try:
+            ax.draw_artist(contour)
+        except AttributeError:
+            # matplotlib<3.8的ContourSet不是单个artist
+            for coll in contour.collections:
+                ax.draw_artist(coll)
+        self.canvas.blit(ax.bbox)
+        return im, True